@@ -0,0 +1,105 @@
+"""Async FPL API client for fetching multiple endpoints concurrently"""
+import asyncio
+import aiohttp
+import orjson
+from typing import Dict, List, Optional, Tuple
+from config import FPL_API_BASE_URL, API_TIMEOUT, MAX_CONCURRENT_REQUESTS
+from models import Player, Fixture
+from api_client import parse_players, parse_fixtures
+
+
+class AsyncFPLAPIClient:
+    """Async client for interacting with the FPL API
+
+    Use as an async context manager so all requests share one
+    aiohttp.ClientSession (and therefore one keep-alive connection pool):
+
+        async with AsyncFPLAPIClient() as client:
+            players, fixtures = await asyncio.gather(
+                client.get_all_players(), client.get_fixtures()
+            )
+    """
+
+    def __init__(self):
+        self.base_url = FPL_API_BASE_URL
+        self.timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncFPLAPIClient":
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            timeout=self.timeout,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._session.close()
+        self._session = None
+
+    async def _get(self, endpoint: str) -> Optional[Dict]:
+        """Make a GET request to the FPL API"""
+        url = f"{self.base_url}{endpoint}"
+        try:
+            async with self._session.get(url) as response:
+                response.raise_for_status()
+                return await response.json(loads=orjson.loads)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+    async def get_all_players(self) -> List[Player]:
+        """Fetch all players and their stats"""
+        data = await self._get("/bootstrap-static/")
+        if not data:
+            return []
+        return parse_players(data)
+
+    async def get_fixtures(self) -> List[Fixture]:
+        """Fetch upcoming fixtures"""
+        data = await self._get("/fixtures/")
+        if not data:
+            return []
+        return parse_fixtures(data)
+
+    async def get_manager(self, manager_id: int) -> Optional[Dict]:
+        """Fetch a manager's entry data"""
+        return await self._get(f"/entry/{manager_id}/")
+
+    async def get_player_histories(self, ids: List[int]) -> Dict[int, Dict]:
+        """Fetch /element/{id}/ history for many players concurrently
+
+        Concurrency is bounded by a semaphore so a full 15-player squad
+        (or larger batches) doesn't hammer the API all at once.
+        """
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def _fetch_one(pid: int):
+            async with sem:
+                return pid, await self._get(f"/element/{pid}/")
+
+        tasks = [_fetch_one(pid) for pid in ids]
+        results = await asyncio.gather(*tasks)
+        return {pid: data for pid, data in results if data is not None}
+
+
+async def _fetch_both() -> Tuple[List[Player], List[Fixture]]:
+    async with AsyncFPLAPIClient() as client:
+        players, fixtures = await asyncio.gather(
+            client.get_all_players(), client.get_fixtures()
+        )
+    return players, fixtures
+
+
+def fetch_players_and_fixtures() -> Tuple[List[Player], List[Fixture]]:
+    """Fetch players and fixtures concurrently (blocking helper for sync callers)"""
+    return asyncio.run(_fetch_both())
+
+
+async def _fetch_histories(ids: List[int]) -> Dict[int, Dict]:
+    async with AsyncFPLAPIClient() as client:
+        return await client.get_player_histories(ids)
+
+
+def fetch_player_histories(ids: List[int]) -> Dict[int, Dict]:
+    """Fetch many player histories concurrently (blocking helper for sync callers)"""
+    return asyncio.run(_fetch_histories(ids))
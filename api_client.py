@@ -1,9 +1,94 @@
 """FPL API Client for fetching data from the official Fantasy Premier League API"""
+import sys
+import orjson
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional
-from config import FPL_API_BASE_URL, API_TIMEOUT, MAX_RETRIES
+from config import (
+    FPL_API_BASE_URL,
+    API_TIMEOUT,
+    MAX_RETRIES,
+    CACHE_DURATION,
+    FIXTURES_CACHE_DURATION,
+)
 from models import Player, Fixture
 
+# FPL element_type -> position string
+_POSITION_MAP = {1: "GKP", 2: "DEF", 3: "MID", 4: "FWD"}
+
+
+def parse_players(data: Dict) -> List[Player]:
+    """Build Player objects from a bootstrap-static response
+
+    Position strings are the shared _POSITION_MAP constants and status
+    strings are interned, so downstream equality checks take CPython's
+    pointer-identity fast path instead of comparing characters.
+    """
+    players = []
+    for player_data in data.get("elements", []):
+        status = player_data.get("status")
+        player = Player(
+            id=player_data["id"],
+            name=f"{player_data['first_name']} {player_data['second_name']}",
+            team=player_data.get("team", ""),
+            position=_POSITION_MAP.get(player_data["element_type"], "Unknown"),
+            price=player_data["now_cost"],
+            points=player_data["total_points"],
+            games_played=player_data["minutes"] // 90,  # Approximate
+            selected_by_percent=float(player_data.get("selected_by_percent", 0)),
+            form=float(player_data.get("form") or 0),
+            chance_of_playing=player_data.get("chance_of_playing_next_round"),
+            status=sys.intern(status) if status else None,
+            available_multiplier=0.5 if status and status != "a" else 1.0,
+        )
+        players.append(player)
+
+    return players
+
+
+def parse_fixtures(data: List[Dict]) -> List[Fixture]:
+    """Build Fixture objects from a /fixtures/ response"""
+    fixtures = []
+    for fixture_data in data:
+        if fixture_data.get("status") == "scheduled":
+            fixture = Fixture(
+                gameweek=fixture_data.get("event", 0),
+                team=fixture_data.get("team_h_name", ""),
+                opponent=fixture_data.get("team_a_name", ""),
+                difficulty=fixture_data.get("team_h_difficulty", 3),
+                is_home=True,
+            )
+            fixtures.append(fixture)
+
+    return fixtures
+
+
+def parse_players_df(data: Dict) -> pd.DataFrame:
+    """Build a struct-of-arrays players DataFrame from a bootstrap-static response
+
+    Column construction is vectorized, so filtering (by position, by id
+    membership) runs at C level instead of per-Player Python loops.
+    """
+    df = pd.DataFrame(data.get("elements", []))
+    if df.empty:
+        return df
+
+    df["name"] = df["first_name"] + " " + df["second_name"]
+    df["position"] = df["element_type"].map(_POSITION_MAP)
+    df["games_played"] = df["minutes"] // 90  # Approximate
+    # Same normalization as parse_players: the API sends these as strings
+    # that may be empty or null, so coerce rather than cast
+    df["selected_by_percent"] = pd.to_numeric(df["selected_by_percent"], errors="coerce").fillna(0.0)
+    df["form"] = pd.to_numeric(df["form"], errors="coerce").fillna(0.0)
+    return df[[
+        "id", "name", "team", "position", "now_cost", "total_points",
+        "games_played", "selected_by_percent", "form",
+        "chance_of_playing_next_round", "status",
+    ]].rename(columns={"now_cost": "price", "total_points": "points"})
+
 
 class FPLAPIClient:
     """Client for interacting with the FPL API"""
@@ -11,67 +96,72 @@ class FPLAPIClient:
     def __init__(self):
         self.base_url = FPL_API_BASE_URL
         self.timeout = API_TIMEOUT
-        self.session = requests.Session()
+        # On-disk HTTP cache: repeat fetches become conditional GETs the FPL
+        # CDN answers with 304 (headers only), and stale_if_error serves
+        # last-good data if the API is down
+        self.session = CachedSession(
+            "fpl_cache",
+            backend="sqlite",
+            expire_after=CACHE_DURATION,
+            # Fixtures change whenever gameweeks complete, so expire them
+            # sooner; the stored ETag/Last-Modified validators turn the
+            # refetch into a headers-only 304 when nothing changed
+            urls_expire_after={"*/fixtures/": FIXTURES_CACHE_DURATION},
+            cache_control=True,
+            stale_if_error=True,
+        )
+        # Sized connection pool with retries handled by urllib3 (proper
+        # exponential backoff, keep-alive reuse across many /element/ calls)
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept-Encoding": "gzip",
+            "User-Agent": "fpl-tool/1.0",
+        })
 
     def _get(self, endpoint: str) -> Optional[Dict]:
-        """Make a GET request to the FPL API with retries"""
+        """Make a GET request to the FPL API (retries handled by the adapter)"""
         url = f"{self.base_url}{endpoint}"
-        
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
-                if attempt == MAX_RETRIES - 1:
-                    print(f"Error fetching {url}: {e}")
-                    return None
-                continue
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            # orjson is ~3-5x faster than stdlib json on the multi-MB
+            # bootstrap-static payload
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            print(f"Error fetching {url}: {e}")
+            return None
 
     def get_all_players(self) -> List[Player]:
         """Fetch all players and their stats"""
         data = self._get("/bootstrap-static/")
         if not data:
             return []
+        return parse_players(data)
 
-        players = []
-        for player_data in data.get("elements", []):
-            player = Player(
-                id=player_data["id"],
-                name=f"{player_data['first_name']} {player_data['second_name']}",
-                team=player_data.get("team", ""),
-                position=self._get_position(player_data["element_type"]),
-                price=player_data["now_cost"],
-                points=player_data["total_points"],
-                games_played=player_data["minutes"] // 90,  # Approximate
-                selected_by_percent=float(player_data.get("selected_by_percent", 0)),
-                form=float(player_data.get("form", 0)),
-                chance_of_playing=player_data.get("chance_of_playing_next_round"),
-                status=player_data.get("status"),
-            )
-            players.append(player)
-
-        return players
+    def get_all_players_df(self) -> pd.DataFrame:
+        """Fetch all players as a DataFrame for vectorized filtering/analysis"""
+        data = self._get("/bootstrap-static/")
+        if not data:
+            return pd.DataFrame()
+        return parse_players_df(data)
 
     def get_fixtures(self) -> List[Fixture]:
         """Fetch upcoming fixtures"""
         data = self._get("/fixtures/")
         if not data:
             return []
-
-        fixtures = []
-        for fixture_data in data:
-            if fixture_data.get("status") == "scheduled":
-                fixture = Fixture(
-                    gameweek=fixture_data.get("event", 0),
-                    team=fixture_data.get("team_h_name", ""),
-                    opponent=fixture_data.get("team_a_name", ""),
-                    difficulty=fixture_data.get("team_h_difficulty", 3),
-                    is_home=True,
-                )
-                fixtures.append(fixture)
-
-        return fixtures
+        return parse_fixtures(data)
 
     def get_player_history(self, player_id: int) -> Optional[Dict]:
         """Fetch historical data for a specific player"""
@@ -100,12 +190,6 @@ class FPLAPIClient:
         
         return None
 
-    @staticmethod
-    def _get_position(position_id: int) -> str:
-        """Convert FPL position ID to position string"""
-        positions = {1: "GKP", 2: "DEF", 3: "MID", 4: "FWD"}
-        return positions.get(position_id, "Unknown")
-
     def close(self):
         """Close the session"""
         self.session.close()
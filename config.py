@@ -7,10 +7,15 @@ FPL_API_BASE_URL = "https://fantasy.premierleague.com/api"
 DEFAULT_GAMES_AHEAD = 5  # Number of games to look ahead for xP calculation
 MIN_POINT_GAIN = 5  # Minimum point gain needed to justify a transfer (accounts for transfer cost)
 TRANSFER_COST = 4  # Points deducted for a transfer
+MAX_RECOMMENDATIONS = 50  # Cap on transfer suggestions returned per player
+MAX_SQUAD_RECOMMENDATIONS = 200  # Cap on suggestions across a full squad plan
 
 # Cache settings (in seconds)
-CACHE_DURATION = 3600  # 1 hour
+CACHE_DURATION = 3600  # 1 hour (bootstrap-static / fixtures)
+MANAGER_CACHE_DURATION = 300  # 5 minutes (per-manager team picks)
+FIXTURES_CACHE_DURATION = 600  # 10 minutes, then revalidate with a conditional GET
 
 # API rate limiting
 API_TIMEOUT = 10  # seconds
 MAX_RETRIES = 3
+MAX_CONCURRENT_REQUESTS = 10  # max in-flight requests for fan-out fetches
@@ -1,4 +1,5 @@
 """Debug script to test API calls"""
+from concurrent.futures import ThreadPoolExecutor
 from api_client import FPLAPIClient
 
 manager_id = 3546221
@@ -8,9 +9,18 @@ print(f"Manager ID: {manager_id}\n")
 
 client = FPLAPIClient()
 
+# The manager, team, and bootstrap fetches are independent, so issue them
+# concurrently over the shared session instead of paying three serial RTTs
+with ThreadPoolExecutor(max_workers=3) as executor:
+    future_manager = executor.submit(client._get, f"/entry/{manager_id}/")
+    future_team = executor.submit(client.get_manager_team, manager_id)
+    future_players = executor.submit(client.get_all_players)
+    manager_data = future_manager.result()
+    player_ids = future_team.result()
+    all_players = future_players.result()
+
 # Test 1: Get manager data
 print("1. Fetching manager data...")
-manager_data = client._get(f"/entry/{manager_id}/")
 if manager_data:
     print(f"   ✓ Manager found: {manager_data.get('player_first_name')} {manager_data.get('player_last_name')}")
     print(f"   Current event: {manager_data.get('current_event')}")
@@ -19,7 +29,6 @@ else:
 
 # Test 2: Get player IDs
 print("\n2. Fetching team player IDs...")
-player_ids = client.get_manager_team(manager_id)
 if player_ids:
     print(f"   ✓ Found {len(player_ids)} players")
     print(f"   Player IDs: {player_ids[:5]}...")  # Show first 5
@@ -28,12 +37,12 @@ else:
 
 # Test 3: Get all players and check IDs
 print("\n3. Fetching all players from FPL...")
-all_players = client.get_all_players()
 print(f"   ✓ Fetched {len(all_players)} total players")
 
 if player_ids and all_players:
     print("\n4. Matching team players...")
-    matched = [p for p in all_players if p.id in player_ids]
+    player_id_set = set(player_ids)
+    matched = [p for p in all_players if p.id in player_id_set]
     print(f"   ✓ Matched {len(matched)} players")
     if matched:
         print("\n   Your team:")
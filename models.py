@@ -3,9 +3,14 @@ from dataclasses import dataclass
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Player:
-    """Represents an FPL player"""
+    """Represents an FPL player
+
+    Frozen + slotted: ~700 instances live for the whole session, so
+    dropping the per-instance __dict__ halves their memory, and being
+    hashable lets players key caches and sets.
+    """
     id: int
     name: str
     team: str
@@ -14,15 +19,16 @@ class Player:
     points: int  # Total points this season
     games_played: int
     selected_by_percent: float
-    form: Optional[float] = None  # Recent form
+    form: float = 0.0  # Recent form (normalized at ingest, never None)
     xp: Optional[float] = None  # Expected points for next X games
     chance_of_playing: Optional[int] = None
     status: Optional[str] = None  # injured, unavailable, etc.
+    available_multiplier: float = 1.0  # 0.5 when flagged injured/unavailable
 
 
-@dataclass
+@dataclass(slots=True)
 class Transfer:
-    """Represents a potential transfer"""
+    """Represents a potential transfer (mutable: calculate_net_gain writes fields)"""
     player_out: Player
     player_in: Player
     games_ahead: int
@@ -43,7 +49,7 @@ class Transfer:
         return self.net_point_gain
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Fixture:
     """Represents an upcoming fixture"""
     gameweek: int
@@ -2,21 +2,65 @@
 FPL Transfer Analyzer - Streamlit Web App
 Helps you identify smart transfers based on expected points and fixture difficulty
 """
+import heapq
 import streamlit as st
 import pandas as pd
+from collections import defaultdict
 from api_client import FPLAPIClient
+from aiohttp_client import fetch_players_and_fixtures
 from transfer_analyzer import TransferAnalyzer
-from config import DEFAULT_GAMES_AHEAD, TRANSFER_COST
+from config import DEFAULT_GAMES_AHEAD, TRANSFER_COST, CACHE_DURATION, MANAGER_CACHE_DURATION
 
 
+@st.cache_data(ttl=CACHE_DURATION)
 def load_data():
-    """Load data from FPL API"""
-    with st.spinner("Fetching FPL data..."):
-        client = FPLAPIClient()
-        players = client.get_all_players()
-        fixtures = client.get_fixtures()
-        client.close()
-    return players, fixtures
+    """Load data from FPL API (cached across reruns)"""
+    return fetch_players_and_fixtures()
+
+
+@st.cache_data(ttl=CACHE_DURATION)
+def group_players_by_position(players):
+    """Bucket players by position once instead of re-scanning per squad slot"""
+    players_by_position = defaultdict(list)
+    for p in players:
+        players_by_position[p.position].append(p)
+    return dict(players_by_position)
+
+
+@st.cache_resource
+def get_analyzer(players_tuple, fixtures_tuple, games_ahead):
+    """Build the TransferAnalyzer once per (data, games_ahead) combination
+
+    The fixture index built in __init__ is reused across reruns instead of
+    being redone on every UI event.
+    """
+    return TransferAnalyzer(list(players_tuple), list(fixtures_tuple), games_ahead)
+
+
+@st.cache_data(ttl=CACHE_DURATION)
+def player_labels(players_tuple):
+    """Precompute selectbox labels once instead of one f-string per option per rerun"""
+    plain = {p.id: f"{p.name} - £{p.price/10:.1f}m" for p in players_tuple}
+    with_position = {p.id: f"{p.name} ({p.position}) - £{p.price/10:.1f}m" for p in players_tuple}
+    return plain, with_position
+
+
+def get_client() -> FPLAPIClient:
+    """Reuse one FPLAPIClient for the whole session
+
+    Closing the client per call would discard the connection pool and TLS
+    session, so every fetch would pay the handshake again. The pool is
+    released when the Streamlit process exits.
+    """
+    if "fpl_client" not in st.session_state:
+        st.session_state["fpl_client"] = FPLAPIClient()
+    return st.session_state["fpl_client"]
+
+
+@st.cache_data(ttl=MANAGER_CACHE_DURATION)
+def fetch_manager_team(manager_id: int):
+    """Fetch a manager's current team IDs (cached across reruns)"""
+    return get_client().get_manager_team(manager_id)
 
 
 def main():
@@ -24,8 +68,15 @@ def main():
     st.title("⚽ FPL Transfer Analyzer")
     st.markdown("Smart transfer recommendations based on expected points and fixture difficulty")
 
-    # Load data
-    players, fixtures = load_data()
+    # Load data once per session (session_state backstops the st.cache_data
+    # layer so a cache eviction mid-session doesn't trigger a refetch)
+    if "players" not in st.session_state:
+        with st.spinner("Fetching FPL data..."):
+            st.session_state["players"], st.session_state["fixtures"] = load_data()
+    players = st.session_state["players"]
+    fixtures = st.session_state["fixtures"]
+
+    labels, labels_with_position = player_labels(tuple(players))
 
     if not players:
         st.error("Failed to fetch FPL data. Please check your internet connection.")
@@ -48,13 +99,12 @@ def main():
         
         if manager_id > 0 and st.button("Load My Team"):
             with st.spinner("Fetching your FPL team..."):
-                client = FPLAPIClient()
-                player_ids = client.get_manager_team(manager_id)
-                client.close()
-                
+                player_ids = fetch_manager_team(manager_id)
+
                 if player_ids:
-                    # Map player IDs to Player objects
-                    fetched_players = [p for p in players if p.id in player_ids]
+                    # Map player IDs to Player objects (set avoids O(N*M) scans)
+                    player_id_set = set(player_ids)
+                    fetched_players = [p for p in players if p.id in player_id_set]
                     
                     if fetched_players:
                         # Organize fetched players by position
@@ -91,22 +141,23 @@ def main():
         squad_values = []
         
         st.subheader("Select Players")
-        
+
+        players_by_position = group_players_by_position(players)
+
         for i, position in enumerate(squad_positions):
             col1, col2 = st.columns([3, 1])
             with col1:
-                # Filter players by position
-                available_players = [p for p in players if p.position == position]
+                available_players = players_by_position.get(position, [])
                 
                 # Initialize session state for this player slot if not exists
                 if f"squad_player_{i}" not in st.session_state:
                     st.session_state[f"squad_player_{i}"] = available_players[0] if available_players else None
                 
-                player = st.selectbox(                
+                player = st.selectbox(
                     f"{position}",
                     options=available_players,
                     key=f"squad_player_{i}",
-                    format_func=lambda p: f"{p.name} - £{p.price/10:.1f}m"
+                    format_func=lambda p: labels[p.id]
                 )
                 if player:
                     current_squad.append(player)
@@ -183,14 +234,14 @@ def main():
                 selected_player = st.selectbox(
                     "Select player to replace (from your squad)",
                     options=current_squad,
-                    format_func=lambda p: f"{p.name} ({p.position}) - £{p.price/10:.1f}m"
+                    format_func=lambda p: labels_with_position[p.id]
                 )
             
             with col2:
                 position_filter = st.checkbox("Same position only", value=True)
 
             if selected_player:
-                analyzer = TransferAnalyzer(players, fixtures, games_ahead)
+                analyzer = get_analyzer(tuple(players), tuple(fixtures), games_ahead)
                 transfers = analyzer.find_smart_transfers(
                     selected_player,
                     position=selected_player.position if position_filter else None
@@ -208,7 +259,6 @@ def main():
                         st.info(f"({len(transfers) - len(affordable_transfers)} transfer(s) filtered out due to budget)")
                     
                     # Get detailed analysis for both players
-                    analyzer = TransferAnalyzer(players, fixtures, games_ahead)
                     current_player_analysis = analyzer.get_player_analysis(selected_player)
                     
                     # Show player comparison summary
@@ -225,20 +275,24 @@ def main():
                     
                     st.divider()
                     
-                    # Build comparison table
-                    df = pd.DataFrame([{
-                        "Player Out": selected_player.name,
-                        "Form Out": f"{current_player_analysis['form']}",
-                        "FDR Out": f"{current_player_analysis['fdr']}",
-                        "→": "→",
-                        "Player In": t.player_in.name,
-                        "Form In": f"{analyzer.get_player_analysis(t.player_in)['form']}",
-                        "FDR In": f"{analyzer.get_player_analysis(t.player_in)['fdr']}",
-                        "£ Cost": f"£{(t.player_in.price - selected_player.price)/10:.1f}m",
-                        "xP Gain": f"{t.expected_points_gain:.1f}",
-                        "Net Gain": f"{t.net_point_gain:.1f}",
-                        "Rating": t.recommendation
-                    } for t in affordable_transfers])
+                    # Build comparison table column-by-column: one analysis
+                    # per unique player, one DataFrame constructor call
+                    unique_in = {t.player_in.id: t.player_in for t in affordable_transfers}
+                    analyses = {pid: analyzer.get_player_analysis(p) for pid, p in unique_in.items()}
+                    n = len(affordable_transfers)
+                    df = pd.DataFrame({
+                        "Player Out": [selected_player.name] * n,
+                        "Form Out": [f"{current_player_analysis['form']}"] * n,
+                        "FDR Out": [f"{current_player_analysis['fdr']}"] * n,
+                        "→": ["→"] * n,
+                        "Player In": [t.player_in.name for t in affordable_transfers],
+                        "Form In": [f"{analyses[t.player_in.id]['form']}" for t in affordable_transfers],
+                        "FDR In": [f"{analyses[t.player_in.id]['fdr']}" for t in affordable_transfers],
+                        "£ Cost": [f"£{(t.player_in.price - selected_player.price)/10:.1f}m" for t in affordable_transfers],
+                        "xP Gain": [f"{t.expected_points_gain:.1f}" for t in affordable_transfers],
+                        "Net Gain": [f"{t.net_point_gain:.1f}" for t in affordable_transfers],
+                        "Rating": [t.recommendation for t in affordable_transfers],
+                    })
                     
                     st.dataframe(df, use_container_width=True)
                 else:
@@ -255,29 +309,42 @@ def main():
         else:
             st.info(f"Analyzing transfer plan for {len(current_squad)} players with £{budget/10:.1f}m budget")
             
-            analyzer = TransferAnalyzer(players, fixtures, games_ahead)
-            all_transfers = []
-            
+            analyzer = get_analyzer(tuple(players), tuple(fixtures), games_ahead)
+
+            # Each per-player list is already sorted by net gain, so merge
+            # them in O(total) instead of concatenating and re-sorting
+            per_player = []
             for player in current_squad:
                 transfers = analyzer.find_smart_transfers(player)
-                affordable = [t for t in transfers if (t.player_in.price - player.price) <= budget]
-                all_transfers.extend([(player, t) for t in affordable])
+                affordable = [(player, t) for t in transfers
+                              if (t.player_in.price - player.price) <= budget]
+                if affordable:
+                    per_player.append(affordable)
+
+            all_transfers = list(heapq.merge(
+                *per_player, key=lambda pair: -pair[1].net_point_gain
+            ))
             
             if all_transfers:
                 st.success(f"Found {len(all_transfers)} affordable transfer option(s)")
                 
-                df = pd.DataFrame([{
-                    "Player Out": out.name,
-                    "Out Form": f"{analyzer.get_player_analysis(out)['form']}",
-                    "Out FDR": f"{analyzer.get_player_analysis(out)['fdr']}",
-                    "→": "→",
-                    "Player In": t.player_in.name,
-                    "In Form": f"{analyzer.get_player_analysis(t.player_in)['form']}",
-                    "In FDR": f"{analyzer.get_player_analysis(t.player_in)['fdr']}",
-                    "£ Cost": f"£{(t.player_in.price - out.price)/10:.1f}m",
-                    "xP Gain": f"{t.expected_points_gain:.1f}",
-                    "Net Gain (pts)": f"{t.net_point_gain:.1f}",
-                } for out, t in all_transfers])
+                unique_players = {}
+                for out, t in all_transfers:
+                    unique_players.setdefault(out.id, out)
+                    unique_players.setdefault(t.player_in.id, t.player_in)
+                analyses = {pid: analyzer.get_player_analysis(p) for pid, p in unique_players.items()}
+                df = pd.DataFrame({
+                    "Player Out": [out.name for out, t in all_transfers],
+                    "Out Form": [f"{analyses[out.id]['form']}" for out, t in all_transfers],
+                    "Out FDR": [f"{analyses[out.id]['fdr']}" for out, t in all_transfers],
+                    "→": ["→"] * len(all_transfers),
+                    "Player In": [t.player_in.name for out, t in all_transfers],
+                    "In Form": [f"{analyses[t.player_in.id]['form']}" for out, t in all_transfers],
+                    "In FDR": [f"{analyses[t.player_in.id]['fdr']}" for out, t in all_transfers],
+                    "£ Cost": [f"£{(t.player_in.price - out.price)/10:.1f}m" for out, t in all_transfers],
+                    "xP Gain": [f"{t.expected_points_gain:.1f}" for out, t in all_transfers],
+                    "Net Gain (pts)": [f"{t.net_point_gain:.1f}" for out, t in all_transfers],
+                })
                 
                 st.dataframe(df, use_container_width=True)
             else:
@@ -290,7 +357,7 @@ def main():
             player1 = st.selectbox(
                 "Player 1",
                 options=players,
-                format_func=lambda p: f"{p.name} - £{p.price/10:.1f}m",
+                format_func=lambda p: labels[p.id],
                 key="p1"
             )
         
@@ -298,7 +365,7 @@ def main():
             player2 = st.selectbox(
                 "Player 2",
                 options=players,
-                format_func=lambda p: f"{p.name} - £{p.price/10:.1f}m",
+                format_func=lambda p: labels[p.id],
                 key="p2"
             )
 
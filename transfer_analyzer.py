@@ -1,7 +1,34 @@
 """Smart transfer analysis logic for FPL"""
+import numpy as np
+import pandas as pd
 from typing import List, Tuple
 from models import Player, Transfer, Fixture
-from config import DEFAULT_GAMES_AHEAD, MIN_POINT_GAIN, TRANSFER_COST
+from config import (
+    DEFAULT_GAMES_AHEAD,
+    MIN_POINT_GAIN,
+    TRANSFER_COST,
+    MAX_RECOMMENDATIONS,
+    MAX_SQUAD_RECOMMENDATIONS,
+)
+
+
+# Integer codes for positions; code 4 is the fallback for unknown positions
+POSITION_IDX = {"GKP": 0, "DEF": 1, "MID": 2, "FWD": 3}
+
+
+def _xp_kernel(forms, fdrs, weights, penalties, games_ahead):
+    """xP formula over SoA arrays: form * games * FDR multiplier * weight * availability"""
+    return forms * games_ahead * ((6.0 - fdrs) / 3.0) * weights * penalties
+
+
+try:
+    # Optional accelerator: JIT-compile the kernel when numba is installed.
+    # The plain NumPy version above is already vectorized, so numba is a
+    # bonus for large player pools, not a requirement.
+    from numba import njit
+    _xp_kernel = njit(cache=True)(_xp_kernel)
+except ImportError:
+    pass
 
 
 class TransferAnalyzer:
@@ -20,49 +47,142 @@ class TransferAnalyzer:
         self.fixtures = fixtures
         self.games_ahead = games_ahead
         
+        # Position weights as an array indexed by POSITION_IDX code (last
+        # slot is the 1.0 fallback), so the vectorized pass gathers weights
+        # by integer instead of string-keyed dict lookups per player
+        self._pos_weights_arr = np.array(
+            [self.POSITION_WEIGHTS[pos] for pos in ("GKP", "DEF", "MID", "FWD")] + [1.0]
+        )
+
         # Build team fixture map for quick FDR lookup
         self.team_fixtures = self._build_team_fixtures()
 
+        # Average FDR per team over the next games_ahead fixtures, computed
+        # once instead of re-sliced and re-summed per player per call
+        self.team_avg_fdr = self._build_team_avg_fdr()
+
+        # Position index so candidate lookup is a ~4x smaller bucket instead
+        # of a full scan per squad slot
+        self.players_by_position = {}
+        for p in self.players:
+            self.players_by_position.setdefault(p.position, []).append(p)
+
+        # Precompute analysis metrics for every player in one vectorized pass
+        self.analyses_df = self._compute_all_analyses()
+
+        # xP per player id, so transfer search never recomputes a candidate's
+        # expected points (recommend_transfers would otherwise redo each one
+        # once per squad slot)
+        self._xp_cache = self.analyses_df["xp"].to_dict()
+
+        # Row indices into _xp_array for each position bucket, so candidate
+        # scoring is a single array gather
+        self._pos_candidate_idx = {
+            pos: np.fromiter((self._id_index[p.id] for p in bucket),
+                             dtype=np.int64, count=len(bucket))
+            for pos, bucket in self.players_by_position.items()
+        }
+
     def _build_team_fixtures(self) -> dict:
-        """Build a map of team -> list of upcoming fixtures"""
+        """Build a map of team -> next games_ahead upcoming fixtures
+
+        games_ahead is fixed for the analyzer's lifetime, so the cap is
+        applied here once instead of re-slicing per lookup.
+        """
         team_fixtures = {}
         for fixture in self.fixtures:
             if fixture.team not in team_fixtures:
                 team_fixtures[fixture.team] = []
             team_fixtures[fixture.team].append(fixture)
-        return team_fixtures
+        return {team: fx[:self.games_ahead] for team, fx in team_fixtures.items()}
+
+    def _build_team_avg_fdr(self) -> dict:
+        """Average the (already capped) fixture difficulties for each team"""
+        team_avg_fdr = {}
+        for team, fixtures in self.team_fixtures.items():
+            if fixtures:
+                team_avg_fdr[team] = round(sum(f.difficulty for f in fixtures) / len(fixtures), 2)
+        return team_avg_fdr
+
+    def _compute_all_analyses(self) -> pd.DataFrame:
+        """Compute form/FDR/weight/xP for every player in one vectorized pass
+
+        Same formula as calculate_expected_points, but run on
+        struct-of-arrays NumPy columns: one gather pass over the Player
+        objects, then pure array arithmetic.
+        """
+        # Bind hot lookups to locals: the generators below touch every player,
+        # and LOAD_FAST beats repeated attribute/MRO lookups on self
+        players = self.players
+        n = len(players)
+        fdr_get = self.team_avg_fdr.get
+        pos_get = POSITION_IDX.get
+
+        ids = np.fromiter((p.id for p in players), dtype=np.int64, count=n)
+        forms = np.fromiter(
+            (round(p.form, 2) for p in players),
+            dtype=np.float64, count=n,
+        )
+        fdrs = np.fromiter(
+            (fdr_get(p.team, 3.0) for p in players),
+            dtype=np.float64, count=n,
+        )
+        pos_idx = np.fromiter(
+            (pos_get(p.position, 4) for p in players),
+            dtype=np.int8, count=n,
+        )
+        weights = self._pos_weights_arr[pos_idx]
+        injury_penalty = np.fromiter(
+            (p.available_multiplier for p in players),
+            dtype=np.float64, count=n,
+        )
+
+        # FDR multiplier inside the kernel maps 1->1.67x, 3->1.0x, 5->0.33x
+        xp = np.round(_xp_kernel(forms, fdrs, weights, injury_penalty, float(self.games_ahead)), 2)
+
+        self._id_index = {pid: i for i, pid in enumerate(ids.tolist())}
+        self._player_pos_idx = pos_idx
+        self._ids_arr = ids
+        self._xp_array = xp
+
+        return pd.DataFrame(
+            {"form": forms, "fdr": fdrs, "position_weight": weights, "xp": xp},
+            index=pd.Index(ids, name="id"),
+        )
+
+    def get_all_player_analyses(self) -> pd.DataFrame:
+        """Analysis metrics (form, fdr, position_weight, xp) for all players, indexed by id"""
+        return self.analyses_df
 
     def get_average_fdr(self, player: Player) -> float:
         """
-        Calculate average Fixture Difficulty Rating for a player's team.
-        
+        Average Fixture Difficulty Rating for a player's team.
+
         FDR ranges from 1 (easiest) to 5 (hardest).
         Lower FDR is better (easier fixtures incoming).
+        Defaults to neutral (3.0) for teams with no upcoming fixtures.
         """
-        if player.team not in self.team_fixtures:
-            return 3.0  # Default to neutral if no fixtures found
-        
-        team_fixtures = self.team_fixtures[player.team][:self.games_ahead]
-        if not team_fixtures:
-            return 3.0
-        
-        avg_fdr = sum(f.difficulty for f in team_fixtures) / len(team_fixtures)
-        return round(avg_fdr, 2)
+        return self.team_avg_fdr.get(player.team, 3.0)
 
     def calculate_expected_points(self, player: Player) -> float:
         """
         Calculate expected points for a player over the next X games.
-        
+
         Factors considered:
         - Recent form (from FPL)
         - Fixture Difficulty Rating (easier = more points)
         - Position-specific scoring potential
         - Injury/unavailability status
+
+        Players known to the analyzer are served from the precomputed cache;
+        the scalar computation below is the fallback for anyone else.
         """
-        if not player.form:
-            return 0.0
+        cached = self._xp_cache.get(player.id)
+        if cached is not None:
+            return float(cached)
 
-        # Base calculation: form * games ahead
+        # Base calculation: form * games ahead (form is always a float, so
+        # a zero-form player falls out of the multiplication naturally)
         xp = player.form * self.games_ahead
         
         # Apply fixture difficulty adjustment (lower FDR is better)
@@ -75,20 +195,25 @@ class TransferAnalyzer:
         position_weight = self.POSITION_WEIGHTS.get(player.position, 1.0)
         xp *= position_weight
         
-        # Injury/unavailability penalty
-        if player.status and player.status != "a":  # 'a' = available
-            xp *= 0.5
-        
+        # Injury/unavailability penalty, precomputed at ingest
+        xp *= player.available_multiplier
+
         return round(xp, 2)
 
     def get_player_analysis(self, player: Player) -> dict:
-        """Get detailed analysis metrics for a player"""
-        return {
-            "form": round(player.form, 2) if player.form else 0.0,
-            "fdr": self.get_average_fdr(player),
-            "position_weight": self.POSITION_WEIGHTS.get(player.position, 1.0),
-            "xp": self.calculate_expected_points(player)
-        }
+        """Get detailed analysis metrics for a player (precomputed lookup)
+
+        Players outside the analyzer's list fall back to the scalar
+        computation, mirroring calculate_expected_points.
+        """
+        if player.id not in self._id_index:
+            return {
+                "form": round(player.form, 2),
+                "fdr": self.get_average_fdr(player),
+                "position_weight": self.POSITION_WEIGHTS.get(player.position, 1.0),
+                "xp": self.calculate_expected_points(player),
+            }
+        return self.analyses_df.loc[player.id].to_dict()
 
     def find_smart_transfers(self, current_player: Player, position: str = None) -> List[Transfer]:
         """
@@ -104,32 +229,46 @@ class TransferAnalyzer:
         if position is None:
             position = current_player.position
 
-        # Get all available players in the same position
-        candidates = [p for p in self.players if p.position == position and p.id != current_player.id]
+        candidates = self.players_by_position.get(position, [])
+        if not candidates:
+            return []
 
-        transfers = []
         current_xp = self.calculate_expected_points(current_player)
 
-        for candidate in candidates:
-            candidate_xp = self.calculate_expected_points(candidate)
-            expected_gain = candidate_xp - current_xp
-            
-            transfer = Transfer(
+        # Score the whole position bucket in one array gather; only gains
+        # clearing the GOOD threshold survive
+        cand_idx = self._pos_candidate_idx[position]
+        gains = self._xp_array[cand_idx] - current_xp
+        good = np.nonzero(gains - TRANSFER_COST >= MIN_POINT_GAIN)[0]
+
+        # Top-K selection via argpartition (O(N)) instead of sorting all good
+        # candidates; +1 slack in case current_player is in the bucket
+        k = min(MAX_RECOMMENDATIONS + 1, len(good))
+        if len(good) > k:
+            good = good[np.argpartition(gains[good], -k)[-k:]]
+        good = good[np.argsort(-gains[good])]
+
+        transfers = []
+        for i in good.tolist():
+            candidate = candidates[i]
+            if candidate.id == current_player.id:
+                continue
+
+            # Winners already cleared the GOOD threshold above, so fill in
+            # the net gain and rating directly instead of dispatching
+            # calculate_net_gain per transfer
+            expected_gain = float(gains[i])
+            transfers.append(Transfer(
                 player_out=current_player,
                 player_in=candidate,
                 games_ahead=self.games_ahead,
                 expected_points_gain=expected_gain,
-                transfer_cost=TRANSFER_COST
-            )
-            transfer.calculate_net_gain()
-            
-            transfers.append(transfer)
-
-        # Sort by net point gain (best first)
-        transfers.sort(key=lambda t: t.net_point_gain, reverse=True)
-        
-        # Return only good recommendations
-        return [t for t in transfers if t.recommendation == "GOOD"]
+                transfer_cost=TRANSFER_COST,
+                net_point_gain=expected_gain - TRANSFER_COST,
+                recommendation="GOOD",
+            ))
+
+        return transfers[:MAX_RECOMMENDATIONS]
 
     def recommend_transfers(self, current_squad: List[Player]) -> List[Transfer]:
         """
@@ -141,13 +280,48 @@ class TransferAnalyzer:
         Returns:
             Prioritized list of recommended transfers
         """
-        all_recommendations = []
-        
-        for player in current_squad:
-            transfers = self.find_smart_transfers(player)
-            all_recommendations.extend(transfers)
-        
-        # Sort by net point gain
-        all_recommendations.sort(key=lambda t: t.net_point_gain, reverse=True)
-        
-        return all_recommendations
+        if not current_squad:
+            return []
+
+        n_squad = len(current_squad)
+        squad_ids = np.fromiter((p.id for p in current_squad), dtype=np.int64, count=n_squad)
+        squad_pos_idx = np.fromiter(
+            (POSITION_IDX.get(p.position, 4) for p in current_squad),
+            dtype=np.int8, count=n_squad,
+        )
+        squad_xps = np.fromiter(
+            (self.calculate_expected_points(p) for p in current_squad),
+            dtype=np.float64, count=n_squad,
+        )
+
+        # One (squad x players) outer subtraction instead of a scored loop
+        # per squad slot; invalid pairs (wrong position, same player) are
+        # masked to -inf so they can never clear the threshold
+        valid = (self._player_pos_idx[None, :] == squad_pos_idx[:, None]) \
+            & (self._ids_arr[None, :] != squad_ids[:, None])
+        gains = np.where(valid, self._xp_array[None, :] - squad_xps[:, None], -np.inf)
+
+        flat = gains.ravel()
+        good = np.nonzero(flat - TRANSFER_COST >= MIN_POINT_GAIN)[0]
+
+        k = min(MAX_SQUAD_RECOMMENDATIONS, len(good))
+        if len(good) > k:
+            good = good[np.argpartition(flat[good], -k)[-k:]]
+        good = good[np.argsort(-flat[good])]
+
+        n_players = len(self.players)
+        recommendations = []
+        for j in good.tolist():
+            out_i, in_i = divmod(j, n_players)
+            expected_gain = float(flat[j])
+            recommendations.append(Transfer(
+                player_out=current_squad[out_i],
+                player_in=self.players[in_i],
+                games_ahead=self.games_ahead,
+                expected_points_gain=expected_gain,
+                transfer_cost=TRANSFER_COST,
+                net_point_gain=expected_gain - TRANSFER_COST,
+                recommendation="GOOD",
+            ))
+
+        return recommendations